@@ -1,15 +1,32 @@
+import sys
 from dataclasses import dataclass
 from typing import TypeVar
 
 from bpo.datamodel.model import Model
+from bpo.datamodel.codegen import build_child_walkers, build_dump, build_load, may_hold_model
+from bpo.datamodel.utils import get_all_properties
 
 T = TypeVar('T')
 
+# fields are stored in slots, dataclass supports this from python 3.10.
+# _parent_ref / _parent_path are slotted on Model
+_DATACLASS_OPTIONS = dict(slots=True) if sys.version_info >= (3, 10) else {}
+
 
 # BaseModel attributes arent static checkable as base class Model is assigned dynamically by the decorator
 # TODO: once Intersection type is availeble this can be fixed: https://github.com/python/typing/issues/213
 def datamodel(cls: T) -> T:
     cls_dict = dict(cls.__dict__)
     cls_dict.pop('__dict__', None)
-    class_new = type(cls.__name__, (Model,), cls_dict)
-    return dataclass(class_new)
\ No newline at end of file
+    class_new = dataclass(type(cls.__name__, (Model,), cls_dict), **_DATACLASS_OPTIONS)
+    class_new.__model_fields__ = tuple(class_new.__annotations__.items())
+    class_new.__model_fields_set__ = frozenset(class_new.__annotations__)
+    class_new.__basemodel_fields__ = tuple(
+        field for field, annotation in class_new.__model_fields__ if may_hold_model(annotation)
+    )
+    class_new.__child_walkers__ = build_child_walkers(class_new)
+    # annotations are resolved once here instead of on every load / dump
+    class_new.load = classmethod(build_load(class_new))
+    class_new.dump = build_dump(class_new)
+    class_new.__all_properties__ = get_all_properties(class_new)
+    return class_new
\ No newline at end of file
@@ -0,0 +1,268 @@
+import enum
+import inspect
+from dataclasses import fields
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union, get_args, get_origin
+
+from bpo.datamodel.types import BaseModel
+from bpo.datamodel.model import ModelParsingException, dump_value
+
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def may_hold_model(annotation: Any) -> bool:
+    """Whether a value parsed for annotation can be (or directly contain in a list) a BaseModel.
+
+    Unknown annotations (Any, TypeVars, forward references...) are assumed to hold models.
+    """
+    if annotation is Any:
+        return True
+    if inspect.isclass(annotation):
+        return issubclass(annotation, (BaseModel, list)) or issubclass(BaseModel, annotation)
+
+    origin_type = get_origin(annotation)
+    if origin_type is Union:
+        return any(may_hold_model(arg) for arg in get_args(annotation))
+    elif origin_type is list:
+        annotation_args = get_args(annotation)
+        return not annotation_args or may_hold_model(annotation_args[0])
+    return origin_type is None
+
+
+def strip_optional(annotation: Any) -> Any:
+    """X for Optional[X], annotation itself otherwise.
+    """
+    annotation_args = get_args(annotation)
+    if get_origin(annotation) is Union and len(annotation_args) == 2 and type(None) in annotation_args:
+        return next(arg for arg in annotation_args if arg is not type(None))
+    return annotation
+
+
+def _union_members(annotation: Any) -> Tuple[Any, ...]:
+    """Union arguments other than NoneType, parsing with NoneType can only give None.
+    """
+    return tuple(arg for arg in get_args(annotation) if arg is not type(None))
+
+
+def _is_model_class(annotation: Any) -> bool:
+    return inspect.isclass(annotation) and issubclass(annotation, BaseModel)
+
+
+def _model_walker(field: str) -> Callable[[BaseModel], Iterable]:
+    return lambda node: (getattr(node, field),)
+
+
+def _model_list_walker(field: str) -> Callable[[BaseModel], Iterable]:
+    return lambda node: getattr(node, field) or ()
+
+
+def _generic_walker(field: str) -> Callable[[BaseModel], Iterable]:
+    def walker(node: BaseModel) -> Iterable:
+        field_value = getattr(node, field)
+        if getattr(type(field_value), "__is_basemodel__", False):
+            return (field_value,)
+        elif isinstance(field_value, list):
+            return [el for el in field_value if getattr(type(el), "__is_basemodel__", False)]
+        return ()
+    return walker
+
+
+def build_child_walkers(cls: Type[BaseModel]) -> Tuple[Callable[[BaseModel], Iterable], ...]:
+    """One callable per field of cls that can hold models, each returns the children (or None) in that field.
+    """
+    walkers = []
+    annotations = dict(cls.__model_fields__)
+    for field in cls.__basemodel_fields__:
+        annotation = strip_optional(annotations[field])
+        if _is_model_class(annotation):
+            walkers.append(_model_walker(field))
+        elif get_origin(annotation) is list and get_args(annotation) and _is_model_class(strip_optional(get_args(annotation)[0])):
+            walkers.append(_model_list_walker(field))
+        else:
+            walkers.append(_generic_walker(field))
+    return tuple(walkers)
+
+
+class _SourceBuilder:
+    """Accumulates generated source lines along with the namespace they are executed in.
+    """
+    def __init__(self, namespace: Dict[str, Any]):
+        self.namespace = namespace
+        self.lines: List[str] = []
+        self._counter = 0
+
+    def line(self, indent: int, code: str):
+        self.lines.append("    " * indent + code)
+
+    def name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def const(self, value: Any) -> str:
+        name = self.name("_t")
+        self.namespace[name] = value
+        return name
+
+    def compile(self, func_name: str, filename: str) -> Callable:
+        source = "\n".join(self.lines)
+        exec(compile(source, filename, "exec"), self.namespace)
+        return self.namespace[func_name]
+
+
+class _LoadBuilder(_SourceBuilder):
+    """Emits the body of a specialised `load`, mirroring the branches of `Model._parse_value`.
+    """
+    def parse_expr(self, annotation: Any, src: str, path: str, nullable: bool=True) -> Optional[str]:
+        """Expression parsing src, None if annotation needs statements (Union of several types).
+
+        nullable=False when the emitted code already checked src is not None.
+        """
+        origin_type = get_origin(annotation)
+        annotation_args = get_args(annotation)
+        guard = f"None if {src} is None else " if nullable else ""
+        if annotation is type(None):
+            return "None"
+        elif inspect.isclass(annotation):
+            annotation_name = self.const(annotation)
+            if issubclass(annotation, BaseModel):
+                return f"{guard}{annotation_name}.load({src}, {path})"
+            return f"{guard}{annotation_name}({src})"
+        elif origin_type is Union:
+            union_members = _union_members(annotation)
+            if not union_members:
+                return "None"
+            elif len(union_members) == 1:
+                # Optional[X]
+                return self.parse_expr(union_members[0], src, path, nullable)
+            return None
+        elif origin_type is list and annotation_args:
+            index, item = self.name("_i"), self.name("_e")
+            item_expr = self.parse_expr(annotation_args[0], item, f"{path} + '.' + str({index})")
+            if item_expr is None:
+                return None
+            return f"{guard}[{item_expr} for {index}, {item} in enumerate({src})]"
+        # anything not specialised goes through the generic parser
+        return f"cls._parse_value({src}, {self.const(annotation)}, {path})"
+
+    def parse_stmt(self, annotation: Any, src: str, dst: str, path: str, indent: int, nullable: bool=True):
+        expr = self.parse_expr(annotation, src, path, nullable)
+        if expr is not None:
+            self.line(indent, f"{dst} = {expr}")
+        elif get_origin(annotation) is Union:
+            union_members = _union_members(annotation)
+            if len(union_members) == 1:
+                # Optional[List[...]] which needs statements
+                self.parse_stmt(union_members[0], src, dst, path, indent, nullable)
+                return
+            # members are tried in declaration order, first non None parsed value wins
+            self.line(indent, f"{dst} = None")
+            self.line(indent, f"if {src} is not None:")
+            for position, union_member in enumerate(union_members):
+                if position:
+                    self.line(indent + 1, f"if {dst} is None:")
+                    self.parse_stmt(union_member, src, dst, path, indent + 2, nullable=False)
+                else:
+                    self.parse_stmt(union_member, src, dst, path, indent + 1, nullable=False)
+        else:
+            # list of unions
+            if nullable:
+                self.line(indent, f"if {src} is None:")
+                self.line(indent + 1, f"{dst} = None")
+                self.line(indent, "else:")
+                indent += 1
+            index, item, parsed = self.name("_i"), self.name("_e"), self.name("_p")
+            self.line(indent, f"{dst} = []")
+            self.line(indent, f"for {index}, {item} in enumerate({src}):")
+            self.parse_stmt(get_args(annotation)[0], item, parsed, f"{path} + '.' + str({index})", indent + 1)
+            self.line(indent + 1, f"{dst}.append({parsed})")
+
+def build_load(cls: Type[BaseModel]) -> Callable:
+    """Generate `load(cls, input_dict, parent_path="root")` specialised on the annotations of cls.
+    """
+    builder = _LoadBuilder(dict(ModelParsingException=ModelParsingException))
+    builder.line(0, 'def load(cls, input_dict, parent_path="root"):')
+
+    parsed_names = {}
+    for attribute, annotation in cls.__annotations__.items():
+        attr_value, parsed = builder.name("_v"), builder.name("_a")
+        attribute_path = f"parent_path + {'.' + attribute!r}"
+        parsed_names[attribute] = parsed
+        builder.line(1, f"{attr_value} = input_dict.get({attribute!r})")
+        builder.line(1, "try:")
+        builder.parse_stmt(annotation, attr_value, parsed, attribute_path, 2)
+        builder.line(1, "except Exception as e:")
+        builder.line(2, "raise ModelParsingException(")
+        builder.line(3, f"attr_path={attribute_path}, type={builder.const(annotation)}, attr_value={attr_value}")
+        builder.line(2, ") from e")
+
+    arguments = ", ".join(f"{attribute}={parsed}" for attribute, parsed in parsed_names.items())
+    builder.line(1, f"parsed_root = cls({arguments})")
+    builder.line(1, "parsed_root._parent_path = parent_path")
+
+    for attribute, annotation in cls.__annotations__.items():
+        if not may_hold_model(annotation):
+            continue
+        parsed = parsed_names[attribute]
+        builder.line(1, f"if getattr(type({parsed}), '__is_basemodel__', False):")
+        builder.line(2, f"{parsed}._parent_ref = parsed_root")
+        builder.line(1, f"elif isinstance({parsed}, list):")
+        builder.line(2, f"for el in {parsed}:")
+        builder.line(3, "if getattr(type(el), '__is_basemodel__', False):")
+        builder.line(4, "el._parent_ref = parsed_root")
+    builder.line(1, "return parsed_root")
+
+    load = builder.compile("load", f"<datamodel {cls.__qualname__}.load>")
+    load.__qualname__ = f"{cls.__qualname__}.load"
+    load.__doc__ = cls.load.__doc__
+    return load
+
+
+class _DumpBuilder(_SourceBuilder):
+    """Emits a specialised `dump`, annotations decide enum / model / list / dict handling up front.
+
+    Enum (including IntEnum / str mixin) values are replaced by .value inline, there is no second pass.
+    """
+    def dump_expr(self, annotation: Any, src: str) -> str:
+        origin_type = get_origin(annotation)
+        annotation_args = get_args(annotation)
+        if annotation in _SCALAR_TYPES:
+            return src
+        elif inspect.isclass(annotation) and issubclass(annotation, enum.Enum):
+            return f"None if {src} is None else {src}.value"
+        elif inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+            return f"None if {src} is None else {src}.dump()"
+        elif origin_type is Union and len(annotation_args) == 2 and type(None) in annotation_args:
+            # Optional[X], every specialised expression already passes None through
+            return self.dump_expr(next(arg for arg in annotation_args if arg is not type(None)), src)
+        elif origin_type is list and annotation_args:
+            item = self.name("_e")
+            item_expr = self.dump_expr(annotation_args[0], item)
+            if item_expr == item:
+                return f"None if {src} is None else list({src})"
+            return f"None if {src} is None else [{item_expr} for {item} in {src}]"
+        elif origin_type is dict and len(annotation_args) == 2:
+            key, item = self.name("_k"), self.name("_e")
+            item_expr = self.dump_expr(annotation_args[1], item)
+            if item_expr == item:
+                return f"None if {src} is None else dict({src})"
+            return f"None if {src} is None else {{{key}: {item_expr} for {key}, {item} in {src}.items()}}"
+        return f"dump_value({src})"
+
+
+def build_dump(cls: Type[BaseModel]) -> Callable:
+    """Generate `dump(self)` specialised on the dataclass fields of cls.
+    """
+    builder = _DumpBuilder(dict(dump_value=dump_value))
+    builder.line(0, "def dump(self):")
+
+    items = []
+    for field in fields(cls):
+        value = builder.name("_v")
+        builder.line(1, f"{value} = self.{field.name}")
+        items.append(f"{field.name!r}: {builder.dump_expr(field.type, value)}")
+    builder.line(1, f"return {{{', '.join(items)}}}")
+
+    dump = builder.compile("dump", f"<datamodel {cls.__qualname__}.dump>")
+    dump.__qualname__ = f"{cls.__qualname__}.dump"
+    dump.__doc__ = cls.dump.__doc__
+    return dump
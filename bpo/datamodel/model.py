@@ -1,17 +1,53 @@
 import enum
+import os
 import traceback
 import inspect
-from collections import defaultdict, deque
-from dataclasses import asdict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from collections import deque
+from functools import partial
+from dataclasses import fields, is_dataclass
 from typing import (
     get_args, get_origin,
     Union, Dict, List, Any, Tuple, Callable, Type, Optional )
 
 from bpo.datamodel.types import BaseModel
-from bpo.datamodel.utils import get_attr_path, get_root_ref
+from bpo.datamodel.utils import get_attr_path
 from bpo.utils.common_utils import DEBUG, WARN, log
 
 
+VALIDATION_WORKER_COUNT_ENV = "BPO_VALIDATION_WORKER_COUNT"
+
+
+def get_validation_worker_count() -> int:
+    """Total number of threads validate(parallel=True) runs validator calls on.
+
+    Read from BPO_VALIDATION_WORKER_COUNT on every call, defaults to min(32, cpu count + 4).
+
+    Raises:
+        ValueError: if the environment variable is not a positive integer.
+    """
+    value = os.environ.get(VALIDATION_WORKER_COUNT_ENV)
+    if value is None:
+        return min(32, (os.cpu_count() or 1) + 4)
+    try:
+        worker_count = int(value)
+    except ValueError:
+        worker_count = 0
+    if worker_count < 1:
+        raise ValueError(f"{VALIDATION_WORKER_COUNT_ENV} must be a positive integer, got: {value!r}")
+    return worker_count
+
+# (attribute path, validator result)
+ValidationRecord = Tuple[str, Any]
+
+
+def group_validation_records(records: List[ValidationRecord]) -> Dict[str, List]:
+    grouped: Dict[str, List] = {}
+    for member_path, error in records:
+        grouped.setdefault(member_path, []).append(error)
+    return grouped
+
+
 class ModelParsingException(Exception):
     def __init__(self, attr_path: str, type: Type, attr_value: Any, *args, **kwargs):
         self.attr_path = attr_path
@@ -50,13 +86,41 @@ class ModelValidationException(Exception):
         return self._message
 
 
+def dump_value(value: Any) -> Any:
+    """Convert a field value to builtins in a single pass.
+
+    Unlike dataclasses.asdict leaves are not deep copied, enums are replaced by their values.
+    """
+    if getattr(type(value), "__is_basemodel__", False):
+        return value.dump()
+    elif isinstance(value, enum.Enum):
+        return value.value
+    elif isinstance(value, list):
+        return [dump_value(v) for v in value]
+    elif isinstance(value, dict):
+        return type(value)((k, dump_value(v)) for k, v in value.items())
+    elif isinstance(value, tuple):
+        if hasattr(value, "_fields"):
+            # namedtuple
+            return type(value)(*[dump_value(v) for v in value])
+        return type(value)(dump_value(v) for v in value)
+    elif is_dataclass(value) and not isinstance(value, type):
+        return {f.name: dump_value(getattr(value, f.name)) for f in fields(value)}
+    return value
+
+
 class Model(BaseModel):
     """BaseModel class for augmenting dataclass functionality with dump/load from dict and validation.
     """
-    _PARENT_PATH_ARG_NAME = "parent_path"
-    _ATTR_PATH_ARG_NAME = "attr_path"
-    _ROOT_REF_ARG_NAME = "root_ref"
-    _PARENT_REF_ARG_NAME = "parent_ref"
+    # parent links live in slots, __dict__ is kept for ad-hoc attributes (e.g. context).
+    # the slots stay unset on models that were constructed directly, read them with a getattr default
+    __slots__ = ("_parent_ref", "_parent_path", "__dict__")
+    # set by the datamodel decorator: (field, annotation) pairs, field names, the fields that can hold child models
+    # and per such field a callable returning its children
+    __model_fields__ = ()
+    __model_fields_set__ = frozenset()
+    __basemodel_fields__ = ()
+    __child_walkers__ = ()
 
     @classmethod
     def _parse_value(cls, value: Any, annotation: Type, attribute_path:str=""):
@@ -89,25 +153,14 @@ class Model(BaseModel):
                 parsed_list.append(parsed_item)
             return parsed_list
 
+    # generic fallbacks for Model subclasses not built by the datamodel decorator,
+    # which replaces load / dump with versions generated by codegen.build_load / codegen.build_dump
     def dump(self):
         """convert object to a dict.
 
         should handle enums gracefully.
         """
-        dict_repr = asdict(self)
-        stack = [dict_repr]
-        while stack:
-            node = stack.pop()
-            for key, value in node.items():
-                if isinstance(value, enum.Enum):
-                    node[key] = value.value
-                elif isinstance(value, dict):
-                    stack.append(value)
-                elif isinstance(value, list):
-                    for v in value:
-                        if isinstance(v, dict):
-                            stack.append(v)
-        return dict_repr
+        return {f.name: dump_value(getattr(self, f.name)) for f in fields(self)}
     
     @classmethod
     def load(cls, input_dict: dict, parent_path="root"):
@@ -141,33 +194,15 @@ class Model(BaseModel):
         parsed_root._parent_path = parent_path
 
         for key, value in processed_input.items():
-            if issubclass(type(value), BaseModel):
+            if getattr(type(value), "__is_basemodel__", False):
                 value._parent_ref = parsed_root
             elif isinstance(value, list):
                 for el in value:
-                    if issubclass(type(el), BaseModel):
+                    if getattr(type(el), "__is_basemodel__", False):
                         el._parent_ref = parsed_root
 
         return parsed_root
     
-    def _get_extra_validate_args(self, validator_func: Callable, field: str) -> Dict[str, Any]:
-        """Pass extras / parent_path / attr_path ONLY if required.
-
-        Avoid unnecessary parsing of extra args.
-        """
-        validation_function_args = dict()
-        validation_function_params = tuple(inspect.signature(validator_func).parameters)
-        for v_func_param in validation_function_params[1:]:
-            if v_func_param == self._PARENT_PATH_ARG_NAME:
-                validation_function_args[v_func_param] = self._parent_path
-            elif v_func_param == self._ATTR_PATH_ARG_NAME:
-                validation_function_args[v_func_param] = self._parent_path + f".{field}"
-            elif v_func_param == self._ROOT_REF_ARG_NAME:
-                validation_function_args[v_func_param] = get_root_ref(self)
-            elif v_func_param == self._PARENT_REF_ARG_NAME:
-                validation_function_args[v_func_param] = self
-        return validation_function_args
-    
     def _bfs(self) -> dict:
         """Collect return values for attributes in self model.
         """
@@ -176,69 +211,128 @@ class Model(BaseModel):
             node = q.popleft()
             yield node
 
-            for field in node.__annotations__:
-                field_value = getattr(node, field)
-                if issubclass(type(field_value), BaseModel):
-                    q.append(field_value)
-                elif isinstance(field_value, list):
-                    for attribute_el in field_value:
-                        if issubclass(type(attribute_el), BaseModel):
-                            q.append(attribute_el)
+            for walker in node.__child_walkers__:
+                for child in walker(node):
+                    if child is not None:
+                        q.append(child)
     
-    def _call_validators(self, validators_map: Optional[Dict[str, List]], stop_on_error: bool=False):
-        result = defaultdict(list)
+    def _call_validator(self, field: str, field_value: Any, member_path: str, validator_data: dict):
+        validator = validator_data["func"]
+        try:
+            log(log_id=DEBUG, message=f"Validating field: {member_path} - validator function - {validator.__name__}")
+            res = validator_data["invoke"](self, field_value, field)
+            if res is not None:
+                log(log_id=WARN, message=f"Validation ERROR for: {member_path}, ErrorResponse: {res}")
+            else:
+                log(log_id=DEBUG, message=f"Validation OK for: {member_path}")
+            return res
+        except Exception as ex:
+            raise ModelValidationException(
+                attr_path = member_path,
+                validation_func=validator
+            ) from ex
+
+    def _validator_calls(self, validators_map: Optional[Dict[str, List]]) -> List[tuple]:
+        """(field, field_value, member_path, validator_data) per validator, in registration order.
+        """
         if validators_map is None:
-            return result
+            return []
+        return [
+            (field, getattr(self, field), get_attr_path(self, field), validator_data)
+            for field, validators in validators_map.items()
+            for validator_data in validators
+        ]
 
-        for field, validators in validators_map.items():
-            field_value = getattr(self, field)
-            member_path = get_attr_path(self, field)
+    def _call_validators(self, validators_map: Optional[Dict[str, List]], stop_on_error: bool=False) -> List[ValidationRecord]:
+        result = []
+        for call in self._validator_calls(validators_map):
+            res = self._call_validator(*call)
+            if res is not None:
+                result.append((call[2], res))
+                if stop_on_error:
+                    return result
+        return result
 
-            for validator_data in validators:
-                validator = validator_data["func"]
+    def _submit_validators(self, executor: Executor, validators_map: Optional[Dict[str, List]]) -> List[Tuple[str, Future]]:
+        return [
+            (call[2], executor.submit(self._call_validator, *call))
+            for call in self._validator_calls(validators_map)
+        ]
 
-                try:
-                    log(log_id=DEBUG, message=f"Validating field: {member_path} - validator function - {validator.__name__}")
-                    res = validator(field_value, **self._get_extra_validate_args(validator, field))
-                    if res is not None:
-                        log(log_id=WARN, message=f"Validation ERROR for: {member_path}, ErrorResponse: {res}")
-                        result[member_path].append(res)
-                        if stop_on_error:
-                            return result
-                    else:
-                        log(log_id=DEBUG, message=f"Validation OK for: {member_path}")
-                except Exception as ex:
-                    raise ModelValidationException(
-                        attr_path = member_path,
-                        validation_func=validator
-                    ) from ex
+    @staticmethod
+    def _collect_validator_results(submitted: List[Tuple[str, Future]], stop_on_error: bool=False) -> List[ValidationRecord]:
+        """Same records as _call_validators, waiting for submitted calls in registration order.
+        """
+        result = []
+        for member_path, future in submitted:
+            res = future.result()
+            if res is not None:
+                result.append((member_path, res))
+                if stop_on_error:
+                    return result
         return result
     
+    def _run_validators(self, executor: Executor, validators_map: Optional[Dict[str, List]],
+                        stop_on_error: bool=False) -> List[ValidationRecord]:
+        """_call_validators running this node's calls on executor.
+        """
+        return self._collect_validator_results(self._submit_validators(executor, validators_map), stop_on_error)
+
     def _call_critical_validations(self):
         return self._call_validators(self._critical_validators, stop_on_error=True)
     
     def _call_normal_validations(self):
         return self._call_validators(self._validators)
 
-    def validate(self) -> Tuple[Dict[str, List], List[Exception]]:
+    @staticmethod
+    def _node_validations(nodes: List["Model"], critical: bool,
+                          executor: Optional[Executor]) -> List[Callable[[], List[ValidationRecord]]]:
+        """Per node a callable returning its critical / normal validation records.
+
+        With an executor normal validator calls of every node are submitted up front, critical ones only
+        when their node's callable runs so no node after a critical error starts validating.
+        """
+        node_validations = []
+        for node in nodes:
+            if executor is None:
+                node_validations.append(node._call_critical_validations if critical else node._call_normal_validations)
+            elif critical:
+                node_validations.append(partial(node._run_validators, executor, node._critical_validators, True))
+            else:
+                submitted = node._submit_validators(executor, node._validators)
+                node_validations.append(partial(node._collect_validator_results, submitted))
+        return node_validations
+
+    def validate(self, parallel: bool=False) -> Tuple[Dict[str, List], List[Exception]]:
         """First performs critical and then normal validations.
 
         If any critical validation fails returns immediately.
+        With parallel=True (node, field, validator) calls run on one shared thread pool
+        (get_validation_worker_count() threads), useful when validators do I/O.
+        Critical validators run node by node, normal ones all at once.
+        Results are still read in registration order, so they match the sequential run.
         """
-        exceptions = []
-        for node in self._bfs():
-            try:
-                critical_errors = node._call_critical_validations()
-                if critical_errors:
-                    return critical_errors, exceptions
-            except Exception as ex:
-                exceptions.append(traceback.format_exc())
-            
-        result = {}
-        for node in self._bfs():
-            try:
-                errors = node._call_normal_validations()
-                result.update(errors)
-            except Exception as ex:
-                exceptions.append(traceback.format_exc())
-        return result, exceptions
\ No newline at end of file
+        # traversed once, both phases visit the same nodes
+        nodes = list(self._bfs())
+        executor = ThreadPoolExecutor(max_workers=get_validation_worker_count()) if parallel else None
+        try:
+            exceptions = []
+            for node_validation in self._node_validations(nodes, critical=True, executor=executor):
+                try:
+                    critical_errors = node_validation()
+                    if critical_errors:
+                        return group_validation_records(critical_errors), exceptions
+                except Exception as ex:
+                    exceptions.append(traceback.format_exc())
+
+            records = []
+            for node_validation in self._node_validations(nodes, critical=False, executor=executor):
+                try:
+                    records.extend(node_validation())
+                except Exception as ex:
+                    exceptions.append(traceback.format_exc())
+            return group_validation_records(records), exceptions
+        finally:
+            if executor is not None:
+                # calls still queued after a critical error are cancelled, running ones are waited for
+                executor.shutdown(cancel_futures=True)
@@ -1,9 +1,27 @@
-from typing import Dict, List, Optional, Callable, Tuple
+import inspect
+from typing import Dict, List, Optional, Callable, Tuple, Any
 from abc import ABC, abstractmethod
 from collections import defaultdict
 
 
+def get_root_ref(node: "BaseModel"):
+    parent = getattr(node, "_parent_ref", None)
+    while parent:
+        node = parent
+        parent = getattr(node, "_parent_ref", None)
+    return node
+
+
 class BaseModel(ABC):
+    __slots__ = ()
+    # checked with getattr(type(value), "__is_basemodel__", False), cheaper than isinstance on an ABC
+    __is_basemodel__ = True
+
+    _PARENT_PATH_ARG_NAME = "parent_path"
+    _ATTR_PATH_ARG_NAME = "attr_path"
+    _ROOT_REF_ARG_NAME = "root_ref"
+    _PARENT_REF_ARG_NAME = "parent_ref"
+
     _parent_ref: Optional["BaseModel"] = None
     _parent_path: str = ""
     _validators: Optional[Dict[str, List]] = None
@@ -16,16 +34,40 @@ class BaseModel(ABC):
     @abstractmethod
     def load(cls, input_dict: dict, parent_path="root") -> "BaseModel": ...
     
+    @classmethod
+    def _build_invoker(cls, validator_func: Callable) -> Callable[["BaseModel", Any, str], Any]:
+        """Generate invoke(node, field_value, field) calling validator_func with the extras it declares.
+
+        parent_path / attr_path / root_ref / parent_ref are passed ONLY if required.
+        """
+        extra_arg_sources = {
+            cls._PARENT_PATH_ARG_NAME: "getattr(node, '_parent_path', '')",
+            cls._ATTR_PATH_ARG_NAME: "f\"{getattr(node, '_parent_path', '')}.{field}\"",
+            cls._ROOT_REF_ARG_NAME: "get_root_ref(node)",
+            cls._PARENT_REF_ARG_NAME: "node",
+        }
+        validation_function_params = tuple(inspect.signature(validator_func).parameters)
+        extra_args = "".join(
+            f", {v_func_param}={extra_arg_sources[v_func_param]}"
+            for v_func_param in validation_function_params[1:]
+            if v_func_param in extra_arg_sources
+        )
+        namespace = dict(validator_func=validator_func, get_root_ref=get_root_ref)
+        source = f"def invoke(node, field_value, field):\n    return validator_func(field_value{extra_args})"
+        exec(compile(source, f"<validator {getattr(validator_func, '__qualname__', validator_func)}>", "exec"), namespace)
+        return namespace["invoke"]
+
     @classmethod
     def add_validator(cls, field: str, validator_func: Callable, critical:bool=False, when: Optional[Callable]=None):
+        validator_data = dict(func=validator_func, when=when, invoke=cls._build_invoker(validator_func))
         if critical:
             if cls._critical_validators is None:
                 cls._critical_validators = defaultdict(list)
-            cls._critical_validators[field].append(dict(func=validator_func, when=when))
+            cls._critical_validators[field].append(validator_data)
         else:
             if cls._validators is None:
                 cls._validators = defaultdict(list)
-            cls._validators[field].append(dict(func=validator_func, when=when))
+            cls._validators[field].append(validator_data)
 
     @abstractmethod
     def validate(self) -> Tuple[Dict[str, List], List[Exception]]: ...
\ No newline at end of file
@@ -1,16 +1,38 @@
 import inspect
 import enum
-from typing import Callable, TypeVar, Optional, Any, Type
-from functools import wraps
-from typing import Any, Union, Dict, List, get_origin, get_args
+from collections import deque
+from typing import Callable, TypeVar, Optional, Any, Type, Tuple, FrozenSet
+from functools import lru_cache, wraps
+from typing import Any, Union, get_origin, get_args
 
-from bpo.datamodel.types import BaseModel
+from bpo.datamodel.types import BaseModel, get_root_ref
 
 
-def get_attr_by_dot_notation(model: BaseModel, dot_notation: str, traverse_parents:bool=False):
+@lru_cache(maxsize=4096)
+def _split_dot_notation(dot_notation: str) -> Tuple[str, ...]:
+    return tuple(dot_notation.split("."))
+
+
+def _get_attr_or_parents(value: Any, attr: str, traverse_parents: bool):
+    try:
+        return getattr(value, attr)
+    except AttributeError:
+        if not traverse_parents:
+            raise
+    # try seeing if any parent name matches
+    parent = value
+    while parent is not None:
+        if attr in parent.__annotations__:
+            return getattr(parent, attr)
+        parent = getattr(parent, "_parent_ref", None)
+    return value
+
+
+def get_attr_by_dot_notation(model: BaseModel, dot_notation: Union[str, Tuple[str, ...]], traverse_parents:bool=False):
     """Get attribute by dot notation.
 
     if traverse_parents is True it will try looking back in parents whether a part exists.
+    dot_notation can also be given already split as a tuple of parts.
 
     Raises:
         AttributeError
@@ -33,60 +55,42 @@ def get_attr_by_dot_notation(model: BaseModel, dot_notation: str, traverse_paren
         For x on 3rd index of c_objs list => "b_obj.c_objs.3.x"
         For all xs on all c_objs => "b_obj.c_objs.*.x"
     """
-    def helper(curr_value, parts):
-        if not parts:
-            return curr_value
-        
-        if curr_value is None:
-            return 
-
-        curr_part = parts[0]
-        prev_value = curr_value
-        if isinstance(curr_value, list):
-            if curr_part == "*":
-                return [helper(v, parts[1:]) for v in curr_value]
-            else:
+    parts = dot_notation if isinstance(dot_notation, tuple) else _split_dot_notation(dot_notation)
+    parts_count = len(parts)
+    result = [None]
+    # (value, index of its next part, list the resolved value goes into, position in that list)
+    work = deque([(model, 0, result, 0)])
+    while work:
+        curr_value, index, out, position = work.popleft()
+        while index < parts_count and curr_value is not None:
+            curr_part = parts[index]
+            if isinstance(curr_value, list):
+                if curr_part == "*":
+                    expanded = [None] * len(curr_value)
+                    work.extend((v, index + 1, expanded, i) for i, v in enumerate(curr_value))
+                    curr_value = expanded
+                    break
                 curr_value = curr_value[int(curr_part)]
-        else:
-            try:
+            elif curr_part in getattr(type(curr_value), "__model_fields_set__", ()):
                 curr_value = getattr(curr_value, curr_part)
-            except AttributeError as aex:
-                if traverse_parents:
-                    # try seeing if any parent name matches
-                    value = prev_value
-                    while value is not None:
-                        if curr_part in value.__annotations__:
-                            curr_value = getattr(value, curr_part)
-                            break
-                        value = value._parent_ref
-                else:
-                    raise aex
-        return helper(curr_value, parts[1:])
-    return helper(model, dot_notation.split("."))
+            else:
+                curr_value = _get_attr_or_parents(curr_value, curr_part, traverse_parents)
+            index += 1
+        out[position] = curr_value
+    return result[0]
 
 
 def get_attr_path(model: BaseModel, attr: str):
-    attr_path = model._parent_path + f".{attr}"
-    attr_path_parts = model._parent_path.split(".") + [ attr ]
-    attr_path = '.'.join(attr_path_parts)
-    return attr_path
+    return f"{getattr(model, '_parent_path', '')}.{attr}"
 
 
-def get_root_ref(node: BaseModel):
-    while node._parent_ref:
-        node = node._parent_ref
-    return node
-
-
-def merge_list_dicts(d1: Dict[str, List], d2: Dict[str, List]):
-    for key in d1:
-        d1[key] += d2.get(key, [])
-    
-    for key, value in d2.items():
-        if key not in d1:
-            d1[key] = value
-
-    return d1
+def get_all_properties(obj) -> FrozenSet[str]:
+    res = set(obj.__annotations__.keys())
+    for var, var_val in inspect.getmembers(obj):
+        if var.startswith("_") or inspect.ismethod(var_val) or inspect.isfunction(var_val):
+            continue
+        res.add(var)
+    return frozenset(res)
 
 
 def validate(
@@ -101,18 +105,11 @@ def validate(
         AttributeError: if field does not exist on model. 
     """
     T = TypeVar("T")
-    def get_all_properties(obj):
-        res = []
-        res.extend(obj.__annotations__.keys())
-        for var, var_val in inspect.getmembers(obj):
-            if var.startswith("_") or inspect.ismethod(var_val) or inspect.isfunction(var_val):
-                continue
-            res.append(var)
-        return res
+    all_properties = getattr(model, "__all_properties__", None) or get_all_properties(model)
 
     def inner(callable: T) -> T:
         model.add_validator(field=field, validator_func=callable, critical=critical, when=when)
-        if field not in get_all_properties(model):
+        if field not in all_properties:
             raise AttributeError(f"Field: {field}, does not exist on model: {model}")
         return callable
     return inner
@@ -123,15 +120,17 @@ def cast_args(function: T) -> T:
     """Casts Model and Enum arguments ( handles lists as well )
     """
     def _cast_to_enum_or_model(annot, value):
-        if issubclass(annot, BaseModel) and isinstance(value, dict):
+        if getattr(annot, "__is_basemodel__", False) and isinstance(value, dict):
             return annot.load(value)
         elif issubclass(annot, enum.Enum):
             return annot(value)
 
+    function_params = tuple(inspect.signature(function).parameters)
+
     @wraps(function)
     def inner(*args, **kwargs):
         # convert all to kwargs
-        arg_names = list(inspect.signature(function).parameters)[:len(args)]
+        arg_names = function_params[:len(args)]
         pw_as_kw = dict(zip(arg_names, args))
         all_args = {**pw_as_kw, **kwargs}
 
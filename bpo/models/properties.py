@@ -1,7 +1,6 @@
 
 
-from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from bpo.datamodel import datamodel
 
@@ -11,7 +10,6 @@ class ServiceAdditionalAttributes:
     token: Optional[str]
 
 
-@dataclass
-class ErrorResponse:
+class ErrorResponse(NamedTuple):
     attributeName: Optional[str] = None
     errorMessage: Optional[str] = None
\ No newline at end of file
@@ -1,6 +1,14 @@
 
 
-from typing import Dict, List
+from typing import Dict, List, Union
+
+try:
+    # optional faster decoder
+    from msgspec import DecodeError as JSONDecodeError
+    from msgspec.json import decode as json_decode
+except ImportError:
+    from json import JSONDecodeError, loads as json_decode
+
 from bpo.models.common import GenericInputs
 from bpo.models.properties import ErrorResponse
 
@@ -31,3 +39,11 @@ def validate_common_attr(inputs: Dict, context=None) -> List[ErrorResponse]:
     inputs_model: GenericInputs = GenericInputs.load(inputs) # type: ignore
     return input_model_validation(inputs_model, context)
 
+
+def validate_common_attr_bytes(raw: Union[bytes, str], context=None) -> List[ErrorResponse]:
+    """Validate a raw JSON request body without the caller decoding it first.
+
+    Raises:
+        JSONDecodeError: if raw is not valid JSON.
+    """
+    return validate_common_attr(json_decode(raw), context)
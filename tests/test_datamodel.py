@@ -0,0 +1,350 @@
+import enum
+import os
+import time
+import unittest
+from dataclasses import dataclass
+from unittest import mock
+from typing import Annotated, Dict, List, Optional, Union
+
+from bpo.datamodel import datamodel
+from bpo.datamodel.model import Model, ModelParsingException, get_validation_worker_count
+from bpo.datamodel.types import get_root_ref
+from bpo.datamodel.utils import get_attr_by_dot_notation, get_attr_path, validate
+from bpo.models.properties import ErrorResponse
+
+
+@datamodel
+class IntFirst:
+    value: Union[int, str]
+
+
+@datamodel
+class StrFirst:
+    value: Union[str, int]
+
+
+@datamodel
+class AnnotatedField:
+    count: Annotated[Optional[int], {"doc": "count"}]
+
+
+@datamodel
+class StrippedName:
+    name: Optional[str]
+
+    def __post_init__(self):
+        if self.name is not None:
+            self.name = self.name.strip()
+
+
+@validate(model=StrippedName, field="name")
+def validate_stripped_name(name: str, root_ref: StrippedName):
+    return None
+
+
+@datamodel
+class CriticalOrder:
+    first: Optional[int]
+    second: Optional[int]
+
+
+@validate(model=CriticalOrder, field="first", critical=True)
+def validate_first_slow(first: int):
+    time.sleep(0.05)
+    return ErrorResponse(attributeName="first", errorMessage="first")
+
+
+@validate(model=CriticalOrder, field="second", critical=True)
+def validate_second_fast(second: int):
+    return ErrorResponse(attributeName="second", errorMessage="second")
+
+
+@datamodel
+class CriticalChild:
+    value: Optional[int]
+
+
+@datamodel
+class CriticalParent:
+    status: Optional[str]
+    children: Optional[List[CriticalChild]]
+
+
+critical_child_calls = []
+
+
+@validate(model=CriticalParent, field="status", critical=True)
+def validate_parent_status(status: str):
+    return ErrorResponse(attributeName="status", errorMessage="status")
+
+
+@validate(model=CriticalChild, field="value", critical=True)
+def validate_child_slow(value: int):
+    critical_child_calls.append(value)
+    time.sleep(0.2)
+
+
+@dataclass
+class PlainModel(Model):
+    """Model subclass not built by the datamodel decorator, uses the generic load / dump.
+    """
+    name: Optional[str]
+
+
+@datamodel
+class HoldsPlainModel:
+    plain: Optional[PlainModel]
+
+
+class TestGenericLoadDump(unittest.TestCase):
+    def test_undecorated_model(self):
+        model = PlainModel.load({"name": "x"})
+        self.assertEqual(model.name, "x")
+        self.assertEqual(model.dump(), {"name": "x"})
+
+    def test_undecorated_model_in_annotation(self):
+        model = HoldsPlainModel.load({"plain": {"name": "x"}})
+        self.assertEqual(model.plain._parent_path, "root.plain")
+        self.assertIs(model.plain._parent_ref, model)
+        self.assertEqual(model.dump(), {"plain": {"name": "x"}})
+
+
+@datamodel
+class Item:
+    value: Optional[int]
+
+
+@datamodel
+class Shapes:
+    item: Optional[Item]
+    items: List[Optional[Item]]
+    grid: List[List[int]]
+    mixed: List[Union[int, str]]
+    either: Union[List[int], str]
+
+
+SHAPES_INPUT = {
+    "item": {"value": "1"},
+    "items": [{"value": 2}, None, {"value": "3"}],
+    "grid": [["1", 2], [], [3]],
+    "mixed": [1, "2"],
+    "either": ["4", 5],
+}
+
+
+class TestGeneratedLoad(unittest.TestCase):
+    def test_matches_parse_value(self):
+        model = Shapes.load(SHAPES_INPUT)
+        for field, annotation in Shapes.__model_fields__:
+            with self.subTest(field=field):
+                self.assertEqual(
+                    getattr(model, field),
+                    Model._parse_value(SHAPES_INPUT[field], annotation, f"root.{field}"),
+                )
+        self.assertEqual(model, Model.load.__func__(Shapes, SHAPES_INPUT))
+
+    def test_none_values(self):
+        model = Shapes.load({"items": [None], "grid": None, "either": None})
+        self.assertEqual(model, Shapes(item=None, items=[None], grid=None, mixed=None, either=None))
+
+    def test_parent_wiring(self):
+        model = Shapes.load(SHAPES_INPUT)
+        self.assertEqual(model._parent_path, "root")
+        self.assertIs(model.item._parent_ref, model)
+        self.assertEqual(model.item._parent_path, "root.item")
+        for index in (0, 2):
+            self.assertIs(model.items[index]._parent_ref, model)
+            self.assertEqual(model.items[index]._parent_path, f"root.items.{index}")
+
+    def test_bad_value(self):
+        with self.assertRaises(ModelParsingException) as raised:
+            Shapes.load({"grid": [[1, "x"]]})
+        self.assertEqual(raised.exception.attr_path, "root.grid")
+        self.assertEqual(raised.exception.attr_value, [[1, "x"]])
+
+    def test_bad_value_in_list_item(self):
+        with self.assertRaises(ModelParsingException) as raised:
+            Shapes.load({"items": [None, {"value": "x"}]})
+        self.assertEqual(raised.exception.attr_path, "root.items")
+        self.assertEqual(raised.exception.__cause__.attr_path, "root.items.1.value")
+
+
+class Color(enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+@datamodel
+class Palette:
+    color: Optional[Color]
+    level: Optional[Level]
+    colors: Optional[List[Color]]
+    color_by_name: Optional[Dict[str, Color]]
+    item_by_name: Optional[Dict[str, Item]]
+    item: Optional[Item]
+
+
+class TestGeneratedDump(unittest.TestCase):
+    def test_enums_and_models(self):
+        palette = Palette(
+            color=Color.RED,
+            level=Level.HIGH,
+            colors=[Color.BLUE, Color.RED],
+            color_by_name={"sky": Color.BLUE},
+            item_by_name={"one": Item(value=1)},
+            item=Item(value=2),
+        )
+        dumped = palette.dump()
+        self.assertEqual(dumped, {
+            "color": "red",
+            "level": 2,
+            "colors": ["blue", "red"],
+            "color_by_name": {"sky": "blue"},
+            "item_by_name": {"one": {"value": 1}},
+            "item": {"value": 2},
+        })
+        self.assertIs(type(dumped["level"]), int)
+
+    def test_nested_models(self):
+        model = Shapes.load(SHAPES_INPUT)
+        self.assertEqual(model.dump(), {
+            "item": {"value": 1},
+            "items": [{"value": 2}, None, {"value": 3}],
+            "grid": [[1, 2], [], [3]],
+            "mixed": [1, 2],
+            "either": [4, 5],
+        })
+        self.assertEqual(Shapes.load(model.dump()), model)
+
+    def test_none_passthrough(self):
+        palette = Palette(color=None, level=None, colors=None, color_by_name=None, item_by_name=None, item=None)
+        self.assertEqual(palette.dump(), dict.fromkeys(Palette.__model_fields_set__))
+        self.assertEqual(Item(value=None).dump(), {"value": None})
+
+
+@datamodel
+class Leaf:
+    x: Optional[int]
+
+
+@datamodel
+class Branch:
+    leaves: Optional[List[Leaf]]
+
+
+@datamodel
+class Tree:
+    name: Optional[str]
+    branches: Optional[List[Branch]]
+
+
+TREE_INPUT = {
+    "name": "tree",
+    "branches": [
+        {"leaves": [{"x": 1}, {"x": 2}]},
+        None,
+        {"leaves": [{"x": 3}]},
+    ],
+}
+
+
+class TestDotNotation(unittest.TestCase):
+    def setUp(self):
+        self.tree = Tree.load(TREE_INPUT)
+
+    def test_nested_wildcards_keep_shape(self):
+        self.assertEqual(get_attr_by_dot_notation(self.tree, "branches.*.leaves.*.x"), [[1, 2], None, [3]])
+
+    def test_none_in_wildcard_list(self):
+        self.assertEqual(
+            get_attr_by_dot_notation(self.tree, "branches.*.leaves"),
+            [self.tree.branches[0].leaves, None, self.tree.branches[2].leaves],
+        )
+
+    def test_index_access(self):
+        self.assertEqual(get_attr_by_dot_notation(self.tree, "branches.0.leaves.1.x"), 2)
+        self.assertRaises(IndexError, get_attr_by_dot_notation, self.tree, "branches.5")
+
+    def test_pre_split_path(self):
+        self.assertEqual(get_attr_by_dot_notation(self.tree, ("branches", "2", "leaves", "0", "x")), 3)
+
+    def test_traverse_parents(self):
+        leaf = self.tree.branches[0].leaves[0]
+        self.assertEqual(get_attr_by_dot_notation(leaf, "name", traverse_parents=True), "tree")
+        # a miss leaves the value where the lookup failed
+        self.assertIs(get_attr_by_dot_notation(leaf, "missing", traverse_parents=True), leaf)
+        self.assertRaises(AttributeError, get_attr_by_dot_notation, leaf, "name")
+
+
+class TestUnionParsing(unittest.TestCase):
+    def test_union_member_order_is_kept_per_model(self):
+        # Union[int, str] == Union[str, int] in typing, each model must still try its own order
+        self.assertEqual(IntFirst.load({"value": "5"}).value, 5)
+        self.assertEqual(StrFirst.load({"value": "5"}).value, "5")
+
+    def test_union_member_order_is_kept_in_parse_value(self):
+        self.assertEqual(IntFirst._parse_value("5", Union[int, str]), 5)
+        self.assertEqual(IntFirst._parse_value("5", Union[str, int]), "5")
+
+    def test_unhashable_annotation(self):
+        # Annotated metadata can be unhashable, building the model and parsing must not raise TypeError
+        model_class = datamodel(type("AnnotatedList", (), {
+            "__annotations__": {"items": Annotated[Optional[List[int]], {"doc": "items"}]},
+        }))
+        model_class.load({"items": [1]})
+        AnnotatedField.load({"count": 3})
+        IntFirst._parse_value({"a": 1}, Dict[str, Annotated[int, {"doc": "a"}]])
+
+
+class TestParentRefs(unittest.TestCase):
+    def test_model_with_own_post_init(self):
+        model = StrippedName.load({"name": " x "})
+        self.assertEqual(model.name, "x")
+        self.assertEqual(model.validate(), ({}, []))
+
+    def test_directly_constructed_model(self):
+        # parent link slots are unset until load, readers fall back to no parent / empty path
+        model = StrippedName(name="x")
+        self.assertIs(get_root_ref(model), model)
+        self.assertEqual(get_attr_path(model, "name"), ".name")
+        self.assertEqual(model.validate(), ({}, []))
+
+    def test_parent_links_are_slotted(self):
+        model = HoldsPlainModel.load({"plain": {"name": "x"}})
+        model.context = {"request": 1}
+        self.assertEqual(vars(model), {"context": {"request": 1}})
+        self.assertEqual(vars(model.plain), {"name": "x"})
+        self.assertIs(model.plain._parent_ref, model)
+
+
+class TestParallelValidation(unittest.TestCase):
+    def test_critical_error_in_registration_order(self):
+        model = CriticalOrder.load({"first": 1, "second": 2})
+        self.assertEqual(model.validate(parallel=True), model.validate())
+        errors, _ = model.validate(parallel=True)
+        self.assertEqual(list(errors), ["root.first"])
+
+    def test_critical_error_stops_later_nodes(self):
+        model = CriticalParent.load({"status": "x", "children": [{"value": i} for i in range(5)]})
+        for parallel in (False, True):
+            critical_child_calls.clear()
+            start = time.perf_counter()
+            errors, _ = model.validate(parallel=parallel)
+            self.assertEqual(list(errors), ["root.status"])
+            self.assertEqual(critical_child_calls, [])
+            self.assertLess(time.perf_counter() - start, 0.1)
+
+    def test_worker_count_from_environment(self):
+        with mock.patch.dict(os.environ, {"BPO_VALIDATION_WORKER_COUNT": "3"}):
+            self.assertEqual(get_validation_worker_count(), 3)
+        with mock.patch.dict(os.environ, {"BPO_VALIDATION_WORKER_COUNT": "abc"}):
+            self.assertRaises(ValueError, get_validation_worker_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
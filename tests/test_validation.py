@@ -0,0 +1,27 @@
+import json
+import unittest
+
+from bpo.validation import JSONDecodeError, validate_common_attr, validate_common_attr_bytes
+
+
+INPUTS = {
+    "name": "escape",
+    "description": "elas" * 100,
+}
+
+
+class TestValidateCommonAttrBytes(unittest.TestCase):
+    def test_bytes_body(self):
+        errors = validate_common_attr_bytes(json.dumps(INPUTS).encode())
+        self.assertTrue(errors)
+        self.assertEqual(errors, validate_common_attr(INPUTS))
+
+    def test_str_body(self):
+        self.assertEqual(validate_common_attr_bytes(json.dumps(INPUTS)), validate_common_attr(INPUTS))
+
+    def test_invalid_json(self):
+        self.assertRaises(JSONDecodeError, validate_common_attr_bytes, b'{"name": ')
+
+
+if __name__ == "__main__":
+    unittest.main()